@@ -13,6 +13,9 @@ Organization: Zenith Tek (https://zenithtek.in)
 Usage:
     python configure_auto_start.py <port> [baud_rate]
     python configure_auto_start.py --list-ports
+    python configure_auto_start.py --discover [--baud-rate BAUD]
+    python configure_auto_start.py --auto-port [--baud-rate BAUD]
+    python configure_auto_start.py --detect [--no-cache] <port>
     python configure_auto_start.py --help
     
 Examples:
@@ -32,35 +35,44 @@ Examples:
     python configure_auto_start.py --list-ports
 """
 
-import argparse
+import json
 import logging
+import os
 import sys
-from typing import Optional
-
-# Import local modules
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Callable, FrozenSet, List, Optional, Tuple
+
+def _exit_missing_modules(error: ImportError) -> None:
+    """Explain which files the tool needs and exit."""
+    print(f"Error: Failed to import required modules: {error}")
+    print("Make sure all files are in the same directory:")
+    print("  - configure_auto_start.py")
+    print("  - platform_utils.py")
+    print("  - sensor_comm.py")
+    print("  - sensor_config.py")
+    sys.exit(1)
+
+
+# Import local modules. sensor_comm and sensor_config (and pyserial with
+# them) are imported by the functions that talk to a sensor, so that
+# --list-ports and --help start quickly.
 try:
     from platform_utils import PlatformUtils
-    from sensor_comm import SensorCommunication
-    from sensor_config import SensorConfigurator
 except ImportError:
     # Try importing from current directory
-    import os
-    import sys
     current_dir = os.path.dirname(os.path.abspath(__file__))
     if current_dir not in sys.path:
         sys.path.insert(0, current_dir)
     try:
         from platform_utils import PlatformUtils
-        from sensor_comm import SensorCommunication
-        from sensor_config import SensorConfigurator
     except ImportError as e:
-        print(f"Error: Failed to import required modules: {e}")
-        print("Make sure all files are in the same directory:")
-        print("  - configure_auto_start.py")
-        print("  - platform_utils.py")
-        print("  - sensor_comm.py")
-        print("  - sensor_config.py")
-        sys.exit(1)
+        _exit_missing_modules(e)
+
+if TYPE_CHECKING:
+    import argparse
+
+    from sensor_config import SensorConfigurator
 
 # Configure logging
 logging.basicConfig(
@@ -76,28 +88,126 @@ ORGANIZATION = "Zenith Tek (https://zenithtek.in)"
 
 # Constants
 DEFAULT_BAUD_RATE = 460800
-SUPPORTED_BAUD_RATES = [230400, 460800, 921600]
+SUPPORTED_BAUD_RATES: Tuple[int, ...] = (230400, 460800, 921600)
+_SUPPORTED_BAUD_SET: FrozenSet[int] = frozenset(SUPPORTED_BAUD_RATES)
+DISCOVERY_CONCURRENCY = 3
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "vibration_auto_mode")
+KNOWN_PORTS_FILE = os.path.join(CACHE_DIR, "known_ports.json")
+MAX_KNOWN_PORTS = 8
+IDENTITY_CACHE_TTL = 300.0
+
+BANNER_LINE = "=" * 64
+
+# Formats a 16-bit register word as 0xNNNN
+WORD_FORMAT = "0x{:04X}".format
+
+# Boolean command-line flags and the attribute each one sets
+CLI_FLAGS = {
+    "--list-ports": "list_ports",
+    "--discover": "discover",
+    "--auto-port": "auto_port",
+    "--exit-auto": "exit_auto",
+    "--persist-disable-auto": "persist_disable_auto",
+    "--detect": "detect",
+    "--reset": "reset",
+    "--no-cache": "no_cache",
+}
 
 
 def list_available_ports() -> None:
     """List all available serial ports."""
-    print(f"\nDetected OS: {PlatformUtils.get_os()}")
-    print(f"Port prefix: {PlatformUtils.get_default_port_prefix()}")
-    print("\nAvailable serial ports:")
+    lines = [
+        "",
+        f"Detected OS: {PlatformUtils.get_os()}",
+        f"Port prefix: {PlatformUtils.get_default_port_prefix()}",
+        "",
+        "Available serial ports:",
+    ]
     
     ports = PlatformUtils.list_serial_ports()
     if ports:
-        for i, port in enumerate(ports, 1):
-            print(f"  {i}. {port}")
-        print(f"\nTotal: {len(ports)} port(s) found")
+        lines.extend(f"  {i}. {port}" for i, port in enumerate(ports, 1))
+        lines.append("")
+        lines.append(f"Total: {len(ports)} port(s) found")
     else:
-        print("  No serial ports found")
-        print("\nTroubleshooting:")
-        print("  - Make sure the sensor is connected")
-        print("  - Check USB cable connection")
-        print("  - Try unplugging and replugging the device")
+        lines.extend(
+            [
+                "  No serial ports found",
+                "",
+                "Troubleshooting:",
+                "  - Make sure the sensor is connected",
+                "  - Check USB cable connection",
+                "  - Try unplugging and replugging the device",
+            ]
+        )
         if PlatformUtils.is_linux():
-            print("  - Check if device appears in: ls -la /dev/ttyUSB*")
+            lines.append("  - Check if device appears in: ls -la /dev/ttyUSB*")
+
+    # Write everything at once; ignore a reader that went away (e.g. | head)
+    try:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Point stdout at devnull so the flush at interpreter exit does not
+        # raise BrokenPipeError again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+
+
+def _load_known_ports() -> List[str]:
+    """Load ports that were configured successfully on earlier runs.
+    
+    Returns:
+        Port names, most recently used first (empty if none are stored)
+    """
+    try:
+        with open(KNOWN_PORTS_FILE, "r", encoding="utf-8") as known_file:
+            ports = json.load(known_file)
+    except (OSError, ValueError):
+        return []
+    if not isinstance(ports, list):
+        return []
+    return [port for port in ports if isinstance(port, str)]
+
+
+def _save_known_port(port: str) -> None:
+    """Remember a port that was configured successfully.
+    
+    Args:
+        port: Port name to store as the most recently used one
+    """
+    ports = [port] + [known for known in _load_known_ports() if known != port]
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(KNOWN_PORTS_FILE, "w", encoding="utf-8") as known_file:
+            json.dump(ports[:MAX_KNOWN_PORTS], known_file)
+    except OSError as exc:
+        logger.debug("Could not save known ports to %s: %s", KNOWN_PORTS_FILE, exc)
+
+
+def _resolve_auto_port() -> Optional[str]:
+    """Pick a port for --auto-port.
+    
+    Previously configured ports that still exist are tried first; the
+    serial ports are only enumerated when none of them is usable.
+    
+    Returns:
+        Port name, or None if no port could be found
+    """
+    for port in _load_known_ports():
+        # COM ports are not filesystem paths, so they cannot be checked cheaply
+        if PlatformUtils.validate_port(port) and (
+            PlatformUtils.is_windows() or os.path.exists(port)
+        ):
+            logger.info("Using previously configured port %s", port)
+            return port
+
+    ports = PlatformUtils.list_serial_ports()
+    if ports:
+        logger.info("Using first available port %s", ports[0])
+        return ports[0]
+    logger.error("No known or available serial port found")
+    return None
 
 
 def validate_baud_rate(baud: int) -> bool:
@@ -109,17 +219,50 @@ def validate_baud_rate(baud: int) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    return baud in SUPPORTED_BAUD_RATES
-
+    return baud in _SUPPORTED_BAUD_SET
+
+
+def _log_banner(title: str) -> None:
+    """Log the tool banner with a command title."""
+    logger.info(BANNER_LINE)
+    logger.info(title)
+    logger.info("Author: %s", AUTHOR)
+    logger.info("Organization: %s", ORGANIZATION)
+    logger.info(BANNER_LINE)
+
+
+def _with_configurator(
+    port: str,
+    baud: int,
+    title: str,
+    failure_message: str,
+    action: Callable[["SensorConfigurator"], bool],
+) -> bool:
+    """Connect to the sensor and run a configurator action.
+    
+    Shared by every command that talks to a sensor: prints the banner,
+    validates the port and baud rate, opens the connection and reports
+    connection errors uniformly.
+    
+    Args:
+        port: Serial port path
+        baud: Baud rate
+        title: Banner title of the command
+        failure_message: Prefix logged when the command raises
+        action: Called with the SensorConfigurator; returns success
+        
+    Returns:
+        Result of action, or False if the command could not run
+    """
+    try:
+        from sensor_comm import SensorCommunication
+        from sensor_config import SensorConfigurator
+    except ImportError as e:
+        _exit_missing_modules(e)
 
-def configure_sensor(port: str, baud: int) -> bool:
     comm: Optional[SensorCommunication] = None
     try:
-        logger.info("=" * 64)
-        logger.info("Vibration Sensor Auto Start Configuration Tool")
-        logger.info("Author: %s", AUTHOR)
-        logger.info("Organization: %s", ORGANIZATION)
-        logger.info("=" * 64)
+        _log_banner(title)
 
         if not PlatformUtils.validate_port(port):
             logger.error("Invalid port: %s", port)
@@ -134,193 +277,267 @@ def configure_sensor(port: str, baud: int) -> bool:
         logger.info("Connecting to %s at %d baud", port, baud)
         comm.open()
 
-        configurator = SensorConfigurator(comm)
-        success = configurator.configure()
-
-        if success:
-            logger.info("=" * 64)
-            logger.info("Configuration succeeded!")
-            logger.info("Developed by %s at %s", AUTHOR, ORGANIZATION)
-            logger.info("=" * 64)
-        return success
+        return action(SensorConfigurator(comm))
 
     except PermissionError as exc:
         logger.error("Permission denied: %s", exc)
-        logger.error("\n" + PlatformUtils.get_port_permission_help())
+        logger.error("\n%s", PlatformUtils.get_port_permission_help())
         return False
     except FileNotFoundError as exc:
         logger.error("Port not found: %s", exc)
         logger.error("Use --list-ports to view available ports")
         return False
     except Exception as exc:
-        logger.error("Configuration failed: %s", exc)
+        logger.error("%s: %s", failure_message, exc)
         return False
     finally:
         if comm:
             comm.close()
 
 
-def detect_sensor_identity(port: str, baud: int) -> bool:
-    comm: Optional[SensorCommunication] = None
-    try:
-        logger.info("=" * 64)
-        logger.info("Vibration Sensor Identity Detection")
-        logger.info("Author: %s", AUTHOR)
-        logger.info("Organization: %s", ORGANIZATION)
-        logger.info("=" * 64)
-
-        if not PlatformUtils.validate_port(port):
-            logger.error("Invalid port: %s", port)
-            logger.error("Examples: %s", PlatformUtils.format_port_examples())
+def configure_sensor(port: str, baud: int) -> bool:
+    def configure(configurator: "SensorConfigurator") -> bool:
+        if not configurator.configure():
             return False
+        _save_known_port(port)
+        logger.info(BANNER_LINE)
+        logger.info("Configuration succeeded!")
+        logger.info("Developed by %s at %s", AUTHOR, ORGANIZATION)
+        logger.info(BANNER_LINE)
+        return True
 
-        if not validate_baud_rate(baud):
-            logger.warning("Baud %s not in recommended list %s", baud, SUPPORTED_BAUD_RATES)
-            logger.warning("Continuing using provided baud rate...")
+    return _with_configurator(
+        port,
+        baud,
+        "Vibration Sensor Auto Start Configuration Tool",
+        "Configuration failed",
+        configure,
+    )
 
-        comm = SensorCommunication(port, baud)
-        logger.info("Connecting to %s at %d baud", port, baud)
-        comm.open()
 
-        configurator = SensorConfigurator(comm)
+def _identity_cache_path(serial_words: List[int]) -> str:
+    """Get the identity cache file for a sensor, keyed by its serial number words."""
+    key = "".join(f"{word:04X}" for word in serial_words)
+    return os.path.join(CACHE_DIR, f"identity_{key}.json")
+
+
+def _load_cached_identity(serial_words: List[int]) -> Optional[dict]:
+    """Load an identity cached within the last IDENTITY_CACHE_TTL seconds.
+    
+    Args:
+        serial_words: Serial number words just read from the sensor
+        
+    Returns:
+        Identity dictionary, or None if there is no fresh cache entry
+    """
+    cache_path = _identity_cache_path(serial_words)
+    try:
+        if time.time() - os.path.getmtime(cache_path) >= IDENTITY_CACHE_TTL:
+            return None
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            identity = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(identity, dict):
+        return None
+    # Only trust entries with the shape _print_identity() expects
+    for key in ("product_id", "serial_number"):
+        if not isinstance(identity.get(key, ""), str):
+            return None
+    for key in ("product_words", "serial_words"):
+        words = identity.get(key, [])
+        if not isinstance(words, list) or not all(type(word) is int for word in words):
+            return None
+    if identity.get("serial_words") != list(serial_words):
+        return None
+    return identity
+
+
+def _save_cached_identity(identity: dict) -> None:
+    """Store an identity under its serial number words.
+    
+    Args:
+        identity: Identity dictionary returned by detect_identity()
+    """
+    cache_path = _identity_cache_path(identity["serial_words"])
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as cache_file:
+            json.dump(identity, cache_file)
+    except (OSError, TypeError) as exc:
+        logger.debug("Could not save identity cache %s: %s", cache_path, exc)
+
+
+def _print_identity(identity: dict) -> None:
+    """Print a sensor identity report."""
+    product_id = identity.get("product_id", "").strip() or "(unknown)"
+    serial_number = identity.get("serial_number", "").strip() or "(unknown)"
+    product_words = identity.get("product_words", [])
+    serial_words = identity.get("serial_words", [])
+
+    print("\nDetected Sensor Identity:\n")
+    print(f"  Product ID   : {product_id}")
+    print(f"  Serial Number: {serial_number}\n")
+    if product_words:
+        print("  Product words: " + " ".join(map(WORD_FORMAT, product_words)))
+    if serial_words:
+        print("  Serial words : " + " ".join(map(WORD_FORMAT, serial_words)))
+    print()
+
+
+def detect_sensor_identity(port: str, baud: int, use_cache: bool = True) -> bool:
+    def detect(configurator: "SensorConfigurator") -> bool:
+        if use_cache:
+            # Only the serial number is read; it identifies the cache entry,
+            # so a different sensor on the same port is never mistaken
+            serial_words = configurator.read_serial_words()
+            identity = _load_cached_identity(serial_words) if serial_words else None
+            if identity is not None:
+                logger.info("Using identity cached for this serial number (use --no-cache to re-read)")
+                _print_identity(identity)
+                return True
+
         identity = configurator.detect_identity()
         if identity is None:
             logger.error("Failed to read sensor identity registers")
             return False
-
-        product_id = identity.get("product_id", "").strip() or "(unknown)"
-        serial_number = identity.get("serial_number", "").strip() or "(unknown)"
-        product_words = identity.get("product_words", [])
-        serial_words = identity.get("serial_words", [])
-
-        print("\nDetected Sensor Identity:\n")
-        print(f"  Product ID   : {product_id}")
-        print(f"  Serial Number: {serial_number}\n")
-        if product_words:
-            print(
-                "  Product words: "
-                + " ".join(f"0x{word:04X}" for word in product_words)
-            )
-        if serial_words:
-            print(
-                "  Serial words : "
-                + " ".join(f"0x{word:04X}" for word in serial_words)
-            )
-        print()
+        _save_cached_identity(identity)
+        _print_identity(identity)
         return True
 
-    except PermissionError as exc:
-        logger.error("Permission denied: %s", exc)
-        logger.error("\n" + PlatformUtils.get_port_permission_help())
-        return False
-    except FileNotFoundError as exc:
-        logger.error("Port not found: %s", exc)
-        logger.error("Use --list-ports to view available ports")
-        return False
-    except Exception as exc:
-        logger.error("Sensor identity detection failed: %s", exc)
-        return False
-    finally:
-        if comm:
-            comm.close()
+    return _with_configurator(
+        port,
+        baud,
+        "Vibration Sensor Identity Detection",
+        "Sensor identity detection failed",
+        detect,
+    )
 
 
 def exit_auto_mode_cli(port: str, baud: int, persist_disable_auto: bool) -> bool:
-    comm: Optional[SensorCommunication] = None
-    try:
-        logger.info("=" * 64)
-        logger.info("Vibration Sensor Auto Mode Exit Utility")
-        logger.info("Author: %s", AUTHOR)
-        logger.info("Organization: %s", ORGANIZATION)
-        logger.info("=" * 64)
-
-        if not PlatformUtils.validate_port(port):
-            logger.error("Invalid port: %s", port)
-            logger.error("Examples: %s", PlatformUtils.format_port_examples())
+    def exit_auto(configurator: "SensorConfigurator") -> bool:
+        if not configurator.exit_auto_mode(persist_disable_auto=persist_disable_auto):
             return False
+        logger.info(BANNER_LINE)
+        logger.info("Auto mode disabled successfully")
+        if persist_disable_auto:
+            logger.info("UART auto bits persisted via flash backup")
+        logger.info(BANNER_LINE)
+        return True
 
-        if not validate_baud_rate(baud):
-            logger.warning("Baud %s not in recommended list %s", baud, SUPPORTED_BAUD_RATES)
-            logger.warning("Continuing using provided baud rate...")
-
-        comm = SensorCommunication(port, baud)
-        logger.info("Connecting to %s at %d baud", port, baud)
-        comm.open()
-
-        configurator = SensorConfigurator(comm)
-        success = configurator.exit_auto_mode(persist_disable_auto=persist_disable_auto)
+    return _with_configurator(
+        port,
+        baud,
+        "Vibration Sensor Auto Mode Exit Utility",
+        "Exit auto mode failed",
+        exit_auto,
+    )
 
-        if success:
-            logger.info("=" * 64)
-            logger.info("Auto mode disabled successfully")
-            if persist_disable_auto:
-                logger.info("UART auto bits persisted via flash backup")
-            logger.info("=" * 64)
-        return success
 
-    except PermissionError as exc:
-        logger.error("Permission denied: %s", exc)
-        logger.error("\n" + PlatformUtils.get_port_permission_help())
-        return False
-    except FileNotFoundError as exc:
-        logger.error("Port not found: %s", exc)
-        logger.error("Use --list-ports to view available ports")
-        return False
-    except Exception as exc:
-        logger.error("Exit auto mode failed: %s", exc)
+def reset_sensor_cli(port: str, baud: int) -> bool:
+    def reset(configurator: "SensorConfigurator") -> bool:
+        if configurator.full_reset():
+            logger.info("Full reset complete. Auto mode bits cleared and persisted.")
+            return True
+        logger.error("Full reset failed")
         return False
-    finally:
-        if comm:
-            comm.close()
 
+    return _with_configurator(
+        port,
+        baud,
+        "Vibration Sensor Reset Utility",
+        "Reset failed",
+        reset,
+    )
 
-def reset_sensor_cli(port: str, baud: int) -> bool:
-    comm: Optional[SensorCommunication] = None
+
+def _probe_port(port: str, baud: int) -> Optional[dict]:
+    """Open a port and read the sensor identity (blocking)."""
     try:
-        logger.info("=" * 64)
-        logger.info("Vibration Sensor Reset Utility")
-        logger.info("Author: %s", AUTHOR)
-        logger.info("Organization: %s", ORGANIZATION)
-        logger.info("=" * 64)
+        from sensor_comm import SensorCommunication
+        from sensor_config import SensorConfigurator
+    except ImportError as e:
+        _exit_missing_modules(e)
 
-        if not PlatformUtils.validate_port(port):
-            logger.error("Invalid port: %s", port)
-            logger.error("Examples: %s", PlatformUtils.format_port_examples())
-            return False
+    comm = SensorCommunication(port, baud)
+    try:
+        comm.open()
+        return SensorConfigurator(comm).detect_identity()
+    finally:
+        comm.close()
 
-        if not validate_baud_rate(baud):
-            logger.warning("Baud %s not in recommended list %s", baud, SUPPORTED_BAUD_RATES)
-            logger.warning("Continuing using provided baud rate...")
 
-        comm = SensorCommunication(port, baud)
-        logger.info("Connecting to %s at %d baud", port, baud)
-        comm.open()
+async def discover_all_sensors_async(baud: int) -> bool:
+    """Probe every candidate serial port concurrently for a sensor.
+    
+    At most DISCOVERY_CONCURRENCY ports are probed at a time. Results are
+    printed as soon as each probe completes.
+    
+    Args:
+        baud: Baud rate used for every probe
+        
+    Returns:
+        True if at least one sensor was found, False otherwise
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
 
-        configurator = SensorConfigurator(comm)
-        if configurator.full_reset():
-            logger.info("Full reset complete. Auto mode bits cleared and persisted.")
-            return True
-        logger.error("Full reset failed")
+    ports = PlatformUtils.list_serial_ports()
+    if not ports:
+        logger.error("No serial ports found")
+        logger.error("Use --list-ports for troubleshooting help")
         return False
 
-    except PermissionError as exc:
-        logger.error("Permission denied: %s", exc)
-        logger.error("\n" + PlatformUtils.get_port_permission_help())
-        return False
-    except FileNotFoundError as exc:
-        logger.error("Port not found: %s", exc)
-        logger.error("Use --list-ports to view available ports")
-        return False
-    except Exception as exc:
-        logger.error("Reset failed: %s", exc)
-        return False
-    finally:
-        if comm:
-            comm.close()
+    logger.info("Probing %d port(s) at %d baud", len(ports), baud)
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+    found = 0
+
+    with ThreadPoolExecutor(max_workers=DISCOVERY_CONCURRENCY) as executor:
+
+        async def probe(port: str) -> Tuple[str, Optional[dict]]:
+            async with semaphore:
+                try:
+                    identity = await loop.run_in_executor(executor, _probe_port, port, baud)
+                except Exception as exc:
+                    logger.warning("Probe of %s failed: %s", port, exc)
+                    identity = None
+                return port, identity
+
+        print("\nDiscovered sensors:\n")
+        for next_result in asyncio.as_completed([probe(port) for port in ports]):
+            port, identity = await next_result
+            if identity is None:
+                continue
+            found += 1
+            product_id = identity.get("product_id", "").strip() or "(unknown)"
+            serial_number = identity.get("serial_number", "").strip() or "(unknown)"
+            print(f"  {port}: {product_id} (S/N {serial_number})")
+
+    if not found:
+        print("  No sensors responded")
+    print(f"\nTotal: {found} sensor(s) found on {len(ports)} port(s)")
+    return found > 0
+
+
+def discover_sensors(baud: int) -> bool:
+    """Probe all available serial ports for sensors.
+    
+    Args:
+        baud: Baud rate used for every probe
+        
+    Returns:
+        True if at least one sensor was found, False otherwise
+    """
+    import asyncio
 
+    return asyncio.run(discover_all_sensors_async(baud))
+
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the full argparse parser (used for --help and error reporting)."""
+    import argparse
 
-def main() -> int:
-    """Main entry point for the configuration script."""
     parser = argparse.ArgumentParser(
         description="Configure M-A542VR1 sensors in UART Auto Start mode",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -339,6 +556,12 @@ Examples:
   
   # List available ports
   python configure_auto_start.py --list-ports
+  
+  # Find sensors on all available ports
+  python configure_auto_start.py --discover
+  
+  # Reuse the last configured port (or the first available one)
+  python configure_auto_start.py --auto-port
         """
     )
     
@@ -359,6 +582,16 @@ Examples:
         action="store_true",
         help="List all available serial ports"
     )
+    parser.add_argument(
+        "--discover",
+        action="store_true",
+        help="Probe all available serial ports and print the identity of each sensor found",
+    )
+    parser.add_argument(
+        "--auto-port",
+        action="store_true",
+        help="When no port is given, use the last successfully configured port or the first available one",
+    )
     parser.add_argument(
         "--baud-rate",
         type=int,
@@ -380,21 +613,88 @@ Examples:
         action="store_true",
         help="Read and print the Product ID and Serial Number from the connected sensor",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="With --detect, always read the identity registers instead of using a recent cached result",
+    )
     parser.add_argument(
         "--reset",
         action="store_true",
         help="Send the full reset sequence (exit auto, flash test, software reset)",
     )
+    return parser
+
+
+def _parse_args(argv: List[str]) -> SimpleNamespace:
+    """Parse command-line arguments.
+    
+    The common invocations are handled by a small hand-written scanner so
+    that argparse does not have to be imported and built on every run.
+    Help requests and anything the scanner does not recognize are handed
+    to the argparse parser, which prints usage or errors as usual.
     
-    args = parser.parse_args()
+    Args:
+        argv: Command-line arguments without the program name
+        
+    Returns:
+        Parsed arguments
+    """
+    args = SimpleNamespace(port=None, baud=DEFAULT_BAUD_RATE)
+    for dest in CLI_FLAGS.values():
+        setattr(args, dest, False)
+
+    positionals: List[str] = []
+    positional_group_done = False
+    index = 0
+    try:
+        while index < len(argv):
+            arg = argv[index]
+            index += 1
+            if not arg.startswith("-"):
+                if positional_group_done or len(positionals) == 2:
+                    raise ValueError(arg)
+                positionals.append(arg)
+                if len(positionals) == 2:
+                    args.baud = int(arg)
+                continue
+
+            if positionals:
+                positional_group_done = True
+            if arg in CLI_FLAGS:
+                setattr(args, CLI_FLAGS[arg], True)
+            elif arg == "--baud-rate" and index < len(argv):
+                args.baud = int(argv[index])
+                index += 1
+            elif arg.startswith("--baud-rate="):
+                args.baud = int(arg[len("--baud-rate="):])
+            else:
+                raise ValueError(arg)
+    except ValueError:
+        return _build_parser().parse_args(argv)
+
+    if positionals:
+        args.port = positionals[0]
+    return args
+
+
+def main() -> int:
+    """Main entry point for the configuration script."""
+    args = _parse_args(sys.argv[1:])
     
     if args.list_ports:
         list_available_ports()
         return 0
 
+    if args.discover:
+        return 0 if discover_sensors(args.baud) else 1
+
+    if args.auto_port and not args.port:
+        args.port = _resolve_auto_port()
+
     if args.exit_auto:
         if not args.port:
-            parser.print_help()
+            _build_parser().print_help()
             print("\nError: port argument is required when using --exit-auto.")
             return 1
         return (
@@ -405,20 +705,20 @@ Examples:
 
     if args.detect:
         if not args.port:
-            parser.print_help()
+            _build_parser().print_help()
             print("\nError: port argument is required when using --detect.")
             return 1
-        return 0 if detect_sensor_identity(args.port, args.baud) else 1
+        return 0 if detect_sensor_identity(args.port, args.baud, not args.no_cache) else 1
 
     if args.reset:
         if not args.port:
-            parser.print_help()
+            _build_parser().print_help()
             print("\nError: port argument is required when using --reset.")
             return 1
         return 0 if reset_sensor_cli(args.port, args.baud) else 1
 
     if not args.port:
-        parser.print_help()
+        _build_parser().print_help()
         print("\nError: Port is required")
         print(f"Use --list-ports to see available ports")
         return 1
@@ -8,15 +8,77 @@ Author: Jnana Phani A (https://phani.zenithtek.in)
 Organization: Zenith Tek (https://zenithtek.in)
 """
 
+import os
 import platform
+import re
 import sys
-from typing import List, Optional
+import time
+from typing import Any, List, Optional
 
 try:
     import serial.tools.list_ports
 except ImportError:
     serial = None
 
+# The OS cannot change while the process is running, so resolve it once
+# instead of calling platform.system() from every helper.
+_OS = platform.system()
+_IS_LINUX = _OS == "Linux"
+_IS_WINDOWS = _OS == "Windows"
+_IS_MACOS = _OS == "Darwin"
+
+# Per-OS values returned by PlatformUtils, selected once at import.
+# _REJECTED/_ACCEPTED_PORT_PREFIXES filter enumerated ports with a single
+# tuple startswith call; _VALID_PORT_PATTERN is matched (anchored) against
+# user-supplied port names.
+if _IS_LINUX:
+    _PORT_PREFIX = "/dev/ttyUSB"
+    _PORT_EXAMPLES = "/dev/ttyUSB0, /dev/ttyUSB1, /dev/ttyACM0, etc."
+    _PERMISSION_HELP = (
+        "Permission denied error. To fix:\n"
+        "  sudo usermod -a -G dialout $USER\n"
+        "  Then log out and log back in\n"
+        "Or run with sudo (not recommended):\n"
+        "  sudo python configure_auto_start.py <port>"
+    )
+    # Skip GPIO ports on Raspberry Pi, include USB serial ports
+    _REJECTED_PORT_PREFIXES = ("/dev/ttyAMA",)
+    _ACCEPTED_PORT_PREFIXES = ("/dev/ttyUSB", "/dev/ttyACM")
+    _VALID_PORT_PATTERN = re.compile(r"/dev/tty")
+elif _IS_WINDOWS:
+    _PORT_PREFIX = "COM"
+    _PORT_EXAMPLES = "COM1, COM2, COM3, etc."
+    _PERMISSION_HELP = "Permission denied. Check if you have access to the serial port."
+    # Include all COM ports
+    _REJECTED_PORT_PREFIXES = ()
+    _ACCEPTED_PORT_PREFIXES = ("COM",)
+    _VALID_PORT_PATTERN = re.compile(r"COM\d+\Z", re.IGNORECASE)
+elif _IS_MACOS:
+    _PORT_PREFIX = "/dev/tty.usbserial"
+    _PORT_EXAMPLES = "/dev/tty.usbserial-*, /dev/tty.usbmodem-*, etc."
+    _PERMISSION_HELP = (
+        "Permission denied error. You may need to:\n"
+        "  1. Add your user to the dialout group\n"
+        "  2. Or run with sudo (not recommended)"
+    )
+    # Include USB serial ports
+    _REJECTED_PORT_PREFIXES = ()
+    _ACCEPTED_PORT_PREFIXES = ("/dev/tty.usbserial", "/dev/tty.usbmodem")
+    _VALID_PORT_PATTERN = re.compile(r"/dev/tty\.")
+else:
+    _PORT_PREFIX = "/dev/ttyUSB"  # Default to Linux-style
+    _PORT_EXAMPLES = "/dev/ttyUSB0, COM1, etc."
+    _PERMISSION_HELP = "Permission denied. Check if you have access to the serial port."
+    # Include and accept any port for unknown OS
+    _REJECTED_PORT_PREFIXES = ()
+    _ACCEPTED_PORT_PREFIXES = ("",)
+    _VALID_PORT_PATTERN = re.compile(r"")
+
+# Enumerating ports walks sysfs / the registry / IOKit, so results are reused
+# for a short time when several helpers ask for them in quick succession.
+PORT_LIST_CACHE_TTL = 2.0
+_port_list_cache = {"time": None, "ports": []}
+
 
 class PlatformUtils:
     """Platform-specific utility functions."""
@@ -28,7 +90,7 @@ class PlatformUtils:
         Returns:
             str: OS name ('Linux', 'Windows', 'Darwin' for macOS, etc.)
         """
-        return platform.system()
+        return _OS
 
     @staticmethod
     def is_linux() -> bool:
@@ -37,7 +99,7 @@ class PlatformUtils:
         Returns:
             bool: True if Linux, False otherwise
         """
-        return PlatformUtils.get_os() == "Linux"
+        return _IS_LINUX
 
     @staticmethod
     def is_windows() -> bool:
@@ -46,7 +108,7 @@ class PlatformUtils:
         Returns:
             bool: True if Windows, False otherwise
         """
-        return PlatformUtils.get_os() == "Windows"
+        return _IS_WINDOWS
 
     @staticmethod
     def is_macos() -> bool:
@@ -55,7 +117,7 @@ class PlatformUtils:
         Returns:
             bool: True if macOS, False otherwise
         """
-        return PlatformUtils.get_os() == "Darwin"
+        return _IS_MACOS
 
     @staticmethod
     def get_default_port_prefix() -> str:
@@ -64,53 +126,76 @@ class PlatformUtils:
         Returns:
             str: Port prefix ('/dev/ttyUSB' for Linux, 'COM' for Windows, '/dev/tty.usbserial' for macOS)
         """
-        if PlatformUtils.is_windows():
-            return "COM"
-        elif PlatformUtils.is_linux():
-            return "/dev/ttyUSB"
-        elif PlatformUtils.is_macos():
-            return "/dev/tty.usbserial"
-        else:
-            return "/dev/ttyUSB"  # Default to Linux-style
+        return _PORT_PREFIX
 
     @staticmethod
     def list_serial_ports() -> List[str]:
         """List all available serial ports.
         
+        Results are cached for PORT_LIST_CACHE_TTL seconds.
+        
         Returns:
             List[str]: List of available serial port names
         """
         if serial is None:
             return []
         
+        now = time.monotonic()
+        cached_at = _port_list_cache["time"]
+        if cached_at is not None and now - cached_at < PORT_LIST_CACHE_TTL:
+            return list(_port_list_cache["ports"])
+        
         ports = []
         try:
             for port_info in serial.tools.list_ports.comports():
                 port_name = port_info.device
-                
-                # Filter out unwanted ports based on OS
-                if PlatformUtils.is_linux():
-                    # Skip GPIO ports on Raspberry Pi
-                    if port_name.startswith("/dev/ttyAMA"):
-                        continue
-                    # Include USB serial ports
-                    if port_name.startswith("/dev/ttyUSB") or port_name.startswith("/dev/ttyACM"):
-                        ports.append(port_name)
-                elif PlatformUtils.is_windows():
-                    # Include all COM ports
-                    if port_name.startswith("COM"):
-                        ports.append(port_name)
-                elif PlatformUtils.is_macos():
-                    # Include USB serial ports
-                    if port_name.startswith("/dev/tty.usbserial") or port_name.startswith("/dev/tty.usbmodem"):
-                        ports.append(port_name)
-                else:
-                    # Include all ports for unknown OS
+                if port_name.startswith(_REJECTED_PORT_PREFIXES):
+                    continue
+                if port_name.startswith(_ACCEPTED_PORT_PREFIXES):
                     ports.append(port_name)
         except Exception:
+            return sorted(ports)
+        
+        ports.sort()
+        _port_list_cache["time"] = now
+        _port_list_cache["ports"] = ports
+        return list(ports)
+
+    @staticmethod
+    def enable_low_latency(connection: Any) -> bool:
+        """Enable low-latency mode on an open serial connection (Linux only).
+        
+        FTDI-style USB adapters buffer received data for up to 16 ms by
+        default; low-latency mode lowers that to 1 ms, which matters for
+        the short register read/write exchanges used by this tool.
+        
+        Args:
+            connection: Open pyserial Serial object
+            
+        Returns:
+            bool: True if low-latency mode was enabled, False otherwise
+        """
+        if not _IS_LINUX or connection is None:
+            return False
+        
+        # ASYNC_LOW_LATENCY via TIOCSSERIAL (pyserial >= 3.1)
+        try:
+            connection.set_low_latency_mode(True)
+            return True
+        except (AttributeError, OSError, ValueError):
             pass
         
-        return sorted(ports)
+        # Fall back to the usb-serial latency timer in sysfs
+        port = getattr(connection, "port", None)
+        if not port:
+            return False
+        device = os.path.basename(os.path.realpath(port))
+        try:
+            with open(f"/sys/bus/usb-serial/devices/{device}/latency_timer", "w") as latency_timer:
+                latency_timer.write("1")
+            return True
+        except OSError:
+            return False
 
     @staticmethod
     def validate_port(port: str) -> bool:
@@ -122,18 +207,7 @@ class PlatformUtils:
         Returns:
             bool: True if valid, False otherwise
         """
-        if not port:
-            return False
-        
-        if PlatformUtils.is_windows():
-            return port.upper().startswith("COM") and port[3:].isdigit()
-        elif PlatformUtils.is_linux():
-            return port.startswith("/dev/tty") or port.startswith("/dev/ttyACM")
-        elif PlatformUtils.is_macos():
-            return port.startswith("/dev/tty.")
-        else:
-            # Accept any port for unknown OS
-            return True
+        return bool(port) and _VALID_PORT_PATTERN.match(port) is not None
 
     @staticmethod
     def get_port_permission_help() -> str:
@@ -142,22 +216,7 @@ class PlatformUtils:
         Returns:
             str: Help text for fixing port permissions
         """
-        if PlatformUtils.is_linux():
-            return (
-                "Permission denied error. To fix:\n"
-                "  sudo usermod -a -G dialout $USER\n"
-                "  Then log out and log back in\n"
-                "Or run with sudo (not recommended):\n"
-                "  sudo python configure_auto_start.py <port>"
-            )
-        elif PlatformUtils.is_macos():
-            return (
-                "Permission denied error. You may need to:\n"
-                "  1. Add your user to the dialout group\n"
-                "  2. Or run with sudo (not recommended)"
-            )
-        else:
-            return "Permission denied. Check if you have access to the serial port."
+        return _PERMISSION_HELP
 
     @staticmethod
     def format_port_examples() -> str:
@@ -166,12 +225,5 @@ class PlatformUtils:
         Returns:
             str: Examples of valid port names
         """
-        if PlatformUtils.is_windows():
-            return "COM1, COM2, COM3, etc."
-        elif PlatformUtils.is_linux():
-            return "/dev/ttyUSB0, /dev/ttyUSB1, /dev/ttyACM0, etc."
-        elif PlatformUtils.is_macos():
-            return "/dev/tty.usbserial-*, /dev/tty.usbmodem-*, etc."
-        else:
-            return "/dev/ttyUSB0, COM1, etc."
+        return _PORT_EXAMPLES
 
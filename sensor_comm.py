@@ -16,14 +16,27 @@ try:
 except ImportError:
     Serial = None
 
+try:
+    from platform_utils import PlatformUtils
+except ImportError:
+    # Try relative import if in package
+    from .platform_utils import PlatformUtils
+
 logger = logging.getLogger(__name__)
 
 # Constants
-FLASH_BACKUP_TIMEOUT = 5.0
-BACKUP_POLL_INTERVAL = 0.1
 DEFAULT_TIMEOUT = 3.0
 DEFAULT_READ_CHUNK_SIZE = 4096
 
+# Minimum command-to-command interval in seconds per baud rate
+# (tWRITERATE/tREADRATE in the datasheet's UART timing table)
+COMMAND_INTERVALS = {
+    115200: 660e-6,
+    230400: 350e-6,
+    460800: 200e-6,
+    921600: 130e-6,
+}
+
 
 class SensorCommunication:
     """Low-level serial communication with sensor."""
@@ -43,11 +56,25 @@ class SensorCommunication:
         self.baud = baud
         self.timeout = timeout
         self.connection: Optional[Serial] = None
+        # Unknown baud rates get the slowest (longest) interval
+        self.command_interval = COMMAND_INTERVALS.get(baud, max(COMMAND_INTERVALS.values()))
+        self._last_command_time = 0.0
+        # Reusable response buffer for polling reads (see read_into)
+        self._poll_buf = bytearray(16)
+        self._poll_view = memoryview(self._poll_buf)
+        # Reusable accumulation buffer for send_commands responses
+        self._resp_buf = bytearray(64)
 
     def open(self) -> None:
-        """Open serial connection to the sensor."""
-        logger.debug(f"Opening connection: {self.port} at {self.baud} baud")
+        """Open serial connection to the sensor.
+        
+        On Linux the port is also switched to low-latency mode, so short
+        register responses are not held back by the adapter's latency timer.
+        """
+        logger.debug("Opening connection: %s at %s baud", self.port, self.baud)
         self.connection = Serial(self.port, self.baud, timeout=self.timeout)
+        if PlatformUtils.enable_low_latency(self.connection):
+            logger.debug("Low-latency mode enabled on %s", self.port)
 
     def close(self) -> None:
         """Close serial connection."""
@@ -64,14 +91,15 @@ class SensorCommunication:
         """
         return self.connection is not None and self.connection.is_open
 
-    def send_command(self, command: List[int]) -> List[int]:
-        """Send a command and read response.
+    def send_raw(self, expected_len: int, payload: bytes) -> bytes:
+        """Send a prebuilt command payload and read its response.
         
         Args:
-            command: Command bytes [length, byte1, byte2, ..., 0x0D]
+            expected_len: Number of response bytes to read (0 for none)
+            payload: Bytes of a single command, without the length prefix
             
         Returns:
-            Response bytes as list of integers
+            Response bytes (empty if no response is expected)
             
         Raises:
             RuntimeError: If connection is not open
@@ -79,16 +107,29 @@ class SensorCommunication:
         if not self.is_open():
             raise RuntimeError("Connection not open")
         
-        # Send command (skip first byte which is expected response length)
-        self.connection.write(bytes(command[1:]))
-        self.connection.flush()
+        self._write_command(payload)
         
         # Read response if expected
-        result = []
-        if command[0] > 0:
-            result = list(self.read_bytes(command[0]))
+        if expected_len > 0:
+            return self.read_bytes(expected_len)
+        return b""
+
+    def _write_command(self, payload: bytes) -> None:
+        """Write one command, keeping the sensor's minimum command interval.
+        
+        The interval is measured from the end of the previous command's
+        flush, which is never shorter than the datasheet's start-to-start
+        minimum.
         
-        return result
+        Args:
+            payload: Bytes of a single command
+        """
+        remaining = self._last_command_time + self.command_interval - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+        self.connection.write(payload)
+        self.connection.flush()
+        self._last_command_time = time.perf_counter()
 
     def read_bytes(self, length: int) -> bytes:
         """Read specified number of bytes from serial port.
@@ -106,34 +147,97 @@ class SensorCommunication:
         if not self.is_open():
             raise RuntimeError("Connection not open")
         
-        result = bytes()
-        while length > 0:
-            read_length = min(length, DEFAULT_READ_CHUNK_SIZE)
-            if read_length > 0:
-                received = self.connection.read(read_length)
-                read_length = len(received)
-                
-                if read_length == 0:
-                    raise TimeoutError("Read timeout occurred")
-                
-                result += received[0:length]
-                length -= read_length
-        
-        return result
-
-    def send_commands(self, commands: List[List[int]]) -> List[int]:
+        # Fill one preallocated buffer instead of concatenating chunks
+        buffer = bytearray(length)
+        self._fill(memoryview(buffer), length)
+        return bytes(buffer)
+
+    def read_into(self, length: int) -> memoryview:
+        """Read bytes into the connection's reusable poll buffer.
+        
+        Polling loops call this on every iteration, so no new buffer is
+        allocated per read. The returned view is only valid until the next
+        call to read_into().
+        
+        Args:
+            length: Number of bytes to read
+            
+        Returns:
+            Memoryview over the bytes read
+            
+        Raises:
+            RuntimeError: If connection is not open
+            TimeoutError: If read times out
+        """
+        if not self.is_open():
+            raise RuntimeError("Connection not open")
+        
+        if length > len(self._poll_buf):
+            # Views may still reference the old buffer, so replace it
+            self._poll_buf = bytearray(length)
+            self._poll_view = memoryview(self._poll_buf)
+        view = self._poll_view[:length]
+        self._fill(view, length)
+        return view
+
+    def _fill(self, view: memoryview, length: int) -> None:
+        """Fill the first ``length`` bytes of ``view`` from the port.
+        
+        Args:
+            view: Writable memoryview to read into
+            length: Number of bytes to read
+            
+        Raises:
+            TimeoutError: If read times out
+        """
+        readinto = self.connection.readinto
+        chunk_size = DEFAULT_READ_CHUNK_SIZE
+        offset = 0
+        while offset < length:
+            received = readinto(view[offset:offset + chunk_size])
+            if not received:
+                raise TimeoutError("Read timeout occurred")
+            offset += received
+
+    def send_commands(self, commands: List[List[int]]) -> memoryview:
         """Send multiple commands sequentially.
         
+        Each command is written on its own, spaced by the sensor's
+        minimum command interval; responses are read as they arrive.
+        
+        Responses are collected in a buffer owned by the connection. The
+        returned view is invalidated by the next send_commands() call;
+        copy it with bytes() to keep it.
+        
         Args:
             commands: List of command byte lists
             
         Returns:
-            Combined response bytes
+            Memoryview over the combined response bytes
+            
+        Raises:
+            RuntimeError: If connection is not open
+            TimeoutError: If a read times out
         """
-        result = []
+        if not self.is_open():
+            raise RuntimeError("Connection not open")
+        
+        # Bound methods looked up once for the whole batch
+        write_command = self._write_command
+        fill = self._fill
+        debug = logger.debug
+        
+        total = sum(command[0] for command in commands)
+        if total > len(self._resp_buf):
+            # Earlier views may still reference the old buffer, so replace it
+            self._resp_buf = bytearray(total)
+        view = memoryview(self._resp_buf)
+        offset = 0
         for command in commands:
-            logger.debug(f"Sending command: {command}")
-            response = self.send_command(command)
-            result.extend(response)
-        return result
-
+            debug("Sending command: %s", command)
+            write_command(bytes(command[1:]))
+            length = command[0]
+            if length > 0:
+                fill(view[offset:offset + length], length)
+                offset += length
+        return view[:offset]
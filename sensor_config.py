@@ -9,9 +9,10 @@ Organization: Zenith Tek (https://zenithtek.in)
 """
 
 import logging
+import struct
 import sys
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 # Import sensor communication module
 try:
@@ -32,7 +33,7 @@ ORGANIZATION = "Zenith Tek (https://zenithtek.in)"
 
 # Constants
 FLASH_BACKUP_TIMEOUT = 5.0
-BACKUP_POLL_INTERVAL = 0.1
+BACKUP_POLL_INTERVAL = 0.01
 
 PROD_ID_REGISTERS = (0x6A, 0x6C, 0x6E, 0x70)
 SERIAL_REGISTERS = (0x74, 0x76, 0x78, 0x7A)
@@ -41,109 +42,154 @@ PRODUCT_ID_ALIASES: Dict[str, str] = {
     "A342VD10": "M-A542VR1",
 }
 
+# Prebuilt command payloads: <register address or 0xFE (window select)>,
+# <value>, 0x0D. Writes set bit 7 of the address. A register read returns
+# 4 bytes: [Addr, MSByte, LSByte, CR]. Each constant is a single command;
+# commands must be written separately to keep the minimum interval.
+_RESET = b"\xFF\xFF\x0D"
+_SELECT_W0 = b"\xFE\x00\x0D"
+_SELECT_W1 = b"\xFE\x01\x0D"
+_MODE_CTRL_CONFIG = b"\x83\x02\x0D"  # Window 0 MODE_CTRL: go to configuration mode
+_UART_CTRL_03 = b"\x88\x03\x0D"  # Window 1 UART_CTRL: AUTO_START=1, UART_AUTO=1
+_UART_CTRL_00 = b"\x88\x00\x0D"  # Window 1 UART_CTRL: auto mode off
+_FLASH_BACKUP = b"\x8A\x08\x0D"  # Window 1 GLOB_CMD: FLASH_BACKUP=1 (bit [3])
+_SOFT_RESET = b"\x8A\x80\x0D"  # Window 1 GLOB_CMD: SOFT_RST=1
+_FLASH_TEST = b"\x83\x08\x0D"  # Window 1 MSC_CTRL: FLASH_TEST=1
+_READ_MODE_CTRL = b"\x02\x00\x0D"  # Window 0
+_READ_DIAG_STAT1 = b"\x04\x00\x0D"  # Window 0
+_READ_MSC_CTRL = b"\x02\x00\x0D"  # Window 1
+_READ_UART_CTRL = b"\x08\x00\x0D"  # Window 1
+_READ_GLOB_CMD = b"\x0A\x00\x0D"  # Window 1
 
 class SensorConfigurator:
     """Sensor configuration operations."""
 
     def __init__(self, comm: SensorCommunication):
         self.comm = comm
+        self._identity_cache: Optional[dict] = None
 
-    def _write_commands(self, commands: List[List[int]]) -> None:
-        self.comm.send_commands(commands)
+    def _write_commands(self, *commands: bytes) -> None:
+        for command in commands:
+            self.comm.send_raw(0, command)
 
     def reset_sensor(self) -> None:
         """Send reset commands to sensor."""
-        self._write_commands(
-            [
-                [0, 0xFF, 0xFF, 0x0D],
-                [0, 0xFF, 0xFF, 0x0D],
-                [0, 0xFF, 0xFF, 0x0D],
-            ]
-        )
+        self._write_commands(_RESET, _RESET, _RESET)
         logger.debug("Sensor reset commands sent")
 
-    def _wait_until_ready(self, timeout: float = 3.0) -> bool:
-        start = time.time()
-        while time.time() - start < timeout:
+    @staticmethod
+    def _sleep_before_next_poll(deadline: float, poll_interval: float) -> None:
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(min(poll_interval, remaining))
+
+    def _wait_until_ready(self, timeout: float = 3.0, poll_interval: float = BACKUP_POLL_INTERVAL) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             try:
-                result = self.comm.send_commands(
-                    [
-                        [0, 0xFE, 0x01, 0x0D],
-                        [4, 0x0A, 0x00, 0x0D],
-                    ]
-                )
+                self._write_commands(_SELECT_W1, _READ_GLOB_CMD)
+                result = self.comm.read_into(4)
                 if len(result) >= 4:
                     glob_cmd = (result[-3] << 8) | result[-2]
                     if (glob_cmd & 0x0400) == 0:
                         return True
             except TimeoutError:
                 logger.debug("Waiting for sensor ready... (timeout)")
-            except Exception:
-                logger.debug("Transient error while waiting for ready", exc_info=True)
-            time.sleep(0.05)
+            except OSError as exc:
+                # SerialException is an OSError; expected while the sensor restarts
+                logger.debug("Transient error while waiting for ready: %s", exc)
+            self._sleep_before_next_poll(deadline, poll_interval)
         logger.warning("Timed out waiting for sensor ready state")
         return False
 
-    def _read_word(self, address: int, window: int) -> Optional[int]:
+    def _read_words(self, window: int, addresses: Sequence[int]) -> List[Optional[int]]:
+        """Read several registers of one window after a single window select.
+        
+        Returns the words read before a failure; the failed register and
+        every one after it are None.
+        """
+        words: List[Optional[int]] = [None] * len(addresses)
         try:
-            result = self.comm.send_commands(
-                [
-                    [0, 0xFE, window & 0xFF, 0x0D],
-                    [4, address & 0xFF, 0x00, 0x0D],
-                ]
-            )
-            if len(result) < 4:
-                return None
-            msb = result[-3]
-            lsb = result[-2]
-            return (msb << 8) | lsb
-        except Exception:
-            logger.debug("Failed to read register 0x%02X", address, exc_info=True)
-            return None
+            self._write_commands(bytes((0xFE, window & 0xFF, 0x0D)))
+            for index, address in enumerate(addresses):
+                # Response is [Addr, MSByte, LSByte, CR]
+                result = self.comm.send_raw(4, bytes((address & 0xFF, 0x00, 0x0D)))
+                words[index] = (result[1] << 8) | result[2]
+        except (TimeoutError, OSError):
+            logger.debug("Failed to read registers in window 0x%02X", window, exc_info=True)
+        return words
 
     @staticmethod
     def _decode_ascii_words(words: List[int], little_endian: bool = True) -> str:
-        chars: List[str] = []
-        for word in words:
-            low = word & 0xFF
-            high = (word >> 8) & 0xFF
-            order = (low, high) if little_endian else (high, low)
-            for byte in order:
-                if byte != 0x00:
-                    chars.append(chr(byte))
-        return "".join(chars).strip()
+        raw = struct.pack(("<" if little_endian else ">") + f"{len(words)}H", *words)
+        # latin-1 maps every byte to the same code point chr() would
+        return raw.replace(b"\x00", b"").decode("latin-1").strip()
 
     def detect_identity(self) -> Optional[dict]:
+        """Read the product ID and serial number of the sensor.
+        
+        The identity registers do not change while the sensor is connected,
+        so the first successful read is cached; see invalidate_identity().
+        
+        Returns:
+            Identity dictionary, or None if the registers could not be read
+        """
+        if self._identity_cache is None:
+            self._identity_cache = self._detect_identity_uncached()
+            if self._identity_cache is None:
+                return None
+        identity = dict(self._identity_cache)
+        identity["product_words"] = list(identity["product_words"])
+        identity["serial_words"] = list(identity["serial_words"])
+        return identity
+
+    def read_serial_words(self) -> Optional[List[int]]:
+        """Read only the serial number registers.
+        
+        Returns:
+            Serial number words, or None if a register could not be read
+        """
+        words = self._read_words(0x01, SERIAL_REGISTERS)
+        self._write_commands(_SELECT_W0)
+        if None in words:
+            return None
+        return words
+
+    def invalidate_identity(self) -> None:
+        """Forget the cached identity so the next detect_identity() re-reads it."""
+        self._identity_cache = None
+
+    def _detect_identity_uncached(self) -> Optional[dict]:
         logger.info("Reading product and serial number registers")
 
-        product_words = []
-        for reg in PROD_ID_REGISTERS:
-            word = self._read_word(reg, 0x01)
+        words = self._read_words(0x01, PROD_ID_REGISTERS + SERIAL_REGISTERS)
+        product_words = words[: len(PROD_ID_REGISTERS)]
+        serial_words = words[len(PROD_ID_REGISTERS) :]
+
+        for reg, word in zip(PROD_ID_REGISTERS, product_words):
             if word is None:
                 logger.error("Failed to read product ID register 0x%02X", reg)
                 return None
-            product_words.append(word)
-        logger.info(
-            "Product ID raw words: %s",
-            " ".join(f"0x{word:04X}" for word in product_words),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Product ID raw words: %s",
+                " ".join(f"0x{word:04X}" for word in product_words),
+            )
         product_id_raw = self._decode_ascii_words(product_words, little_endian=True)
         product_id = PRODUCT_ID_ALIASES.get(product_id_raw, product_id_raw)
 
-        serial_words = []
-        for reg in SERIAL_REGISTERS:
-            word = self._read_word(reg, 0x01)
+        for reg, word in zip(SERIAL_REGISTERS, serial_words):
             if word is None:
                 logger.error("Failed to read serial register 0x%02X", reg)
                 return None
-            serial_words.append(word)
-        logger.info(
-            "Serial number raw words: %s",
-            " ".join(f"0x{word:04X}" for word in serial_words),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Serial number raw words: %s",
+                " ".join(f"0x{word:04X}" for word in serial_words),
+            )
         serial_number = self._decode_ascii_words(serial_words, little_endian=True)
 
-        self._write_commands([[0, 0xFE, 0x00, 0x0D]])
+        self._write_commands(_SELECT_W0)
         return {
             "product_id": product_id or "",
             "product_id_raw": product_id_raw or "",
@@ -157,18 +203,14 @@ class SensorConfigurator:
             self.reset_sensor()
             time.sleep(0.1)
 
-            commands = [
-                [0, 0xFE, 0x01, 0x0D],
-                [0, 0x88, 0x03, 0x0D],
-            ]
-            self._write_commands(commands)
+            self._write_commands(_SELECT_W1, _UART_CTRL_03)
             logger.info("UART_CTRL register set to 0x03 (AUTO_START=1, UART_AUTO=1)")
             return True
         except Exception as e:
             logger.error("Failed to set UART_CTRL: %s", e)
             return False
 
-    def flash_backup(self) -> bool:
+    def flash_backup(self, poll_interval: float = BACKUP_POLL_INTERVAL) -> bool:
         """Perform non-volatile memory backup to persist Auto Start setting.
         
         According to documentation:
@@ -176,129 +218,147 @@ class SensorConfigurator:
         2. Wait for backup completion by polling GLOB_CMD bit [3]
         3. Verify backup result by checking FLASH_BU_ERR in DIAG_STAT1
         
+        Args:
+            poll_interval: Seconds to wait between GLOB_CMD polls
+        
         Returns:
             True if backup successful, False otherwise
         """
         try:
-            # Step 1: Write FLASH_BACKUP command
-            commands = [
-                [0, 0xFE, 0x01, 0x0D],  # Window 1
-                [0, 0x8A, 0x08, 0x0D],  # GLOB_CMD: FLASH_BACKUP=1 (bit [3])
-            ]
-            self.comm.send_commands(commands)
+            # Step 1: Write FLASH_BACKUP command (window 1, GLOB_CMD bit [3])
+            self._write_commands(_SELECT_W1, _FLASH_BACKUP)
             logger.info("Flash backup command sent")
+            return self._finish_flash_backup(poll_interval)
+        except Exception as e:
+            logger.error("Flash backup failed: %s", e)
+            return False
+
+    def _finish_flash_backup(self, poll_interval: float) -> bool:
+        """Wait for a triggered flash backup and check FLASH_BU_ERR.
+        
+        Args:
+            poll_interval: Seconds to wait between GLOB_CMD polls
             
-            # Step 2: Wait for backup completion by polling GLOB_CMD
-            start_time = time.time()
-            while time.time() - start_time < FLASH_BACKUP_TIMEOUT:
-                # Read GLOB_CMD register
-                read_commands = [
-                    [0, 0xFE, 0x01, 0x0D],  # Window 1
-                    [4, 0x0A, 0x00, 0x0D],  # Read GLOB_CMD -> 4 bytes
-                ]
-                result = self.comm.send_commands(read_commands)
-                
-                # Check bit [3] of GLOB_CMD (FLASH_BACKUP status)
-                # Result format: [Addr, MSByte, LSByte, CR] for each read
-                if len(result) >= 4:
-                    # GLOB_CMD is 16-bit, bit [3] is in the lower byte
-                    glob_cmd_low = result[2]  # LSByte
-                    if (glob_cmd_low & 0b00001000) == 0:
-                        logger.info("Flash backup completed")
-                        break
-                time.sleep(BACKUP_POLL_INTERVAL)
+        Returns:
+            True if backup successful, False otherwise
+        """
+        # Step 2: Wait for backup completion by polling GLOB_CMD
+        deadline = time.monotonic() + FLASH_BACKUP_TIMEOUT
+        while time.monotonic() < deadline:
+            # Read GLOB_CMD register (window 1) -> 4 bytes
+            self._write_commands(_SELECT_W1, _READ_GLOB_CMD)
+            result = self.comm.read_into(4)
+            
+            # Check bit [3] of GLOB_CMD (FLASH_BACKUP status)
+            # Result format: [Addr, MSByte, LSByte, CR] for each read
+            if len(result) >= 4:
+                # GLOB_CMD is 16-bit, bit [3] is in the lower byte
+                glob_cmd_low = result[2]  # LSByte
+                if (glob_cmd_low & 0b00001000) == 0:
+                    logger.info("Flash backup completed")
+                    break
+            self._sleep_before_next_poll(deadline, poll_interval)
+        else:
+            logger.error("Flash backup timeout - backup may not have completed")
+            return False
+        
+        # Step 3: Verify backup result by checking FLASH_BU_ERR
+        # Read DIAG_STAT1 (window 0) -> 4 bytes
+        self._write_commands(_SELECT_W0)
+        result = self.comm.send_raw(4, _READ_DIAG_STAT1)
+        
+        if len(result) >= 4:
+            # Check FLASH_BU_ERR (bit [0] of DIAG_STAT1)
+            diag_stat1_low = result[2]  # LSByte
+            if (diag_stat1_low & 0b00000001) == 0:
+                logger.info("Flash backup verified successfully")
+                return True
             else:
-                logger.error("Flash backup timeout - backup may not have completed")
+                logger.error("Flash backup error detected (FLASH_BU_ERR=1)")
                 return False
+        else:
+            logger.error("Failed to read DIAG_STAT1 for verification")
+            return False
+
+    def _configure_auto_start(self, poll_interval: float = BACKUP_POLL_INTERVAL) -> bool:
+        """Set UART Auto Start, check it took effect, then back it up to flash.
+        
+        Follows the datasheet's Auto Start and Non-Volatile Memory Backup
+        procedures. UART_CTRL is read back before FLASH_BACKUP is
+        triggered, so a command the sensor missed is never persisted.
+        
+        Args:
+            poll_interval: Seconds to wait between GLOB_CMD polls
             
-            # Step 3: Verify backup result by checking FLASH_BU_ERR
-            verify_commands = [
-                [0, 0xFE, 0x00, 0x0D],  # Window 0
-                [4, 0x04, 0x00, 0x0D],  # Read DIAG_STAT1 -> 4 bytes
-            ]
-            result = self.comm.send_commands(verify_commands)
+        Returns:
+            True if backup successful, False otherwise
+        """
+        try:
+            self.reset_sensor()
+            time.sleep(0.1)
             
-            if len(result) >= 4:
-                # Check FLASH_BU_ERR (bit [0] of DIAG_STAT1)
-                diag_stat1_low = result[2]  # LSByte
-                if (diag_stat1_low & 0b00000001) == 0:
-                    logger.info("Flash backup verified successfully")
-                    return True
-                else:
-                    logger.error("Flash backup error detected (FLASH_BU_ERR=1)")
-                    return False
-            else:
-                logger.error("Failed to read DIAG_STAT1 for verification")
+            self._write_commands(_SELECT_W1, _UART_CTRL_03)
+            result = self.comm.send_raw(4, _READ_UART_CTRL)
+            if len(result) < 4 or (result[2] & 0x03) != 0x03:
+                logger.error("UART_CTRL did not read back AUTO_START=1, UART_AUTO=1; not saving to flash")
                 return False
-                
+            logger.info("UART_CTRL register set to 0x03 (AUTO_START=1, UART_AUTO=1)")
         except Exception as e:
-            logger.error(f"Flash backup failed: {e}")
+            logger.error("Failed to set UART_CTRL: %s", e)
+            return False
+        
+        try:
+            self._write_commands(_SELECT_W1, _FLASH_BACKUP)
+            logger.info("Flash backup command sent")
+            return self._finish_flash_backup(poll_interval)
+        except Exception as e:
+            logger.error("Flash backup failed: %s", e)
             return False
 
     def configure(self) -> bool:
         """Configure sensor in UART Auto Start mode."""
         try:
-            if not self.set_uart_auto_start():
-                return False
-            if not self.flash_backup():
+            if not self._configure_auto_start():
                 return False
             logger.info("Sensor configured in UART Auto Start mode successfully")
             logger.info("After power cycle or reset, sensor will automatically start transmitting data")
-            logger.info(f"Configuration tool by {AUTHOR} at {ORGANIZATION}")
+            logger.info("Configuration tool by %s at %s", AUTHOR, ORGANIZATION)
             return True
             
         except Exception as e:
-            logger.error(f"Configuration failed: {e}")
+            logger.error("Configuration failed: %s", e)
             return False
 
     def software_reset(self) -> bool:
         try:
-            self._write_commands(
-                [
-                    [0, 0xFE, 0x01, 0x0D],
-                    [0, 0x8A, 0x80, 0x0D],
-                ]
-            )
+            self._write_commands(_SELECT_W1, _SOFT_RESET)
             logger.info("Software reset command issued; waiting for reboot")
             return self._wait_until_ready(timeout=7.0)
         except Exception as exc:
             logger.error("Software reset failed: %s", exc)
             return False
 
-    def flash_test(self) -> bool:
+    def flash_test(self, poll_interval: float = BACKUP_POLL_INTERVAL) -> bool:
         try:
-            self._write_commands(
-                [
-                    [0, 0xFE, 0x01, 0x0D],
-                    [0, 0x83, 0x08, 0x0D],
-                ]
-            )
+            self._write_commands(_SELECT_W1, _FLASH_TEST)
             logger.info("Flash test command issued")
 
-            start = time.time()
-            while time.time() - start < FLASH_BACKUP_TIMEOUT:
-                result = self.comm.send_commands(
-                    [
-                        [0, 0xFE, 0x01, 0x0D],
-                        [4, 0x02, 0x00, 0x0D],
-                    ]
-                )
+            deadline = time.monotonic() + FLASH_BACKUP_TIMEOUT
+            while time.monotonic() < deadline:
+                self._write_commands(_SELECT_W1, _READ_MSC_CTRL)
+                result = self.comm.read_into(4)
                 if len(result) >= 4:
                     status = (result[-3] << 8) | result[-2]
                     if (status & 0x0400) == 0:
                         logger.debug("FLASH_TEST complete (MSC_CTRL=0x%04X)", status)
                         break
-                time.sleep(BACKUP_POLL_INTERVAL)
+                self._sleep_before_next_poll(deadline, poll_interval)
             else:
                 logger.error("Flash test timeout")
                 return False
 
-            diag_result = self.comm.send_commands(
-                [
-                    [0, 0xFE, 0x00, 0x0D],
-                    [4, 0x04, 0x00, 0x0D],
-                ]
-            )
+            self._write_commands(_SELECT_W0)
+            diag_result = self.comm.send_raw(4, _READ_DIAG_STAT1)
             if len(diag_result) >= 4:
                 diag_low = diag_result[-2]
                 if diag_low & 0x04:
@@ -314,20 +374,11 @@ class SensorConfigurator:
     def exit_auto_mode(self, persist_disable_auto: bool = False) -> bool:
         try:
             logger.info("Requesting vibration sensor to exit UART Auto Mode")
-            self._write_commands(
-                [
-                    [0, 0xFE, 0x00, 0x0D],
-                    [0, 0x83, 0x02, 0x0D],
-                ]
-            )
+            self._write_commands(_SELECT_W0, _MODE_CTRL_CONFIG)
             time.sleep(0.05)
 
-            result = self.comm.send_commands(
-                [
-                    [0, 0xFE, 0x00, 0x0D],
-                    [4, 0x02, 0x00, 0x0D],
-                ]
-            )
+            self._write_commands(_SELECT_W0)
+            result = self.comm.send_raw(4, _READ_MODE_CTRL)
 
             if len(result) < 4:
                 logger.error("MODE_CTRL read response incomplete")
@@ -339,12 +390,7 @@ class SensorConfigurator:
                 return False
             logger.info("Sensor reports configuration mode (MODE_CTRL=0x%04X)", mode_register)
 
-            self._write_commands(
-                [
-                    [0, 0xFE, 0x01, 0x0D],
-                    [0, 0x88, 0x00, 0x0D],
-                ]
-            )
+            self._write_commands(_SELECT_W1, _UART_CTRL_00)
             logger.info("UART_CTRL cleared (0x88 -> 0x00)")
 
             if persist_disable_auto:
@@ -353,7 +399,7 @@ class SensorConfigurator:
                     logger.error("Failed to persist UART auto disable state")
                     return False
 
-            self._write_commands([[0, 0xFE, 0x00, 0x0D]])
+            self._write_commands(_SELECT_W0)
             return True
 
         except Exception as exc:
@@ -370,7 +416,7 @@ class SensorConfigurator:
                 if not self.exit_auto_mode(persist_disable_auto=True):
                     return False
             else:
-                self._write_commands([[0, 0xFE, 0x00, 0x0D]])
+                self._write_commands(_SELECT_W0)
 
             self.reset_sensor()
             time.sleep(0.1)